@@ -8,10 +8,15 @@ Demonstrates:
 4. Comparing track characteristics
 """
 
+import heapq
+
+import numpy as np
+
 from shifters import (
     GeoJSONTrackParser,
     RacingVehicle,
     MobilitySimulation,
+    SegmentType,
 )
 
 # Path to the F1 circuits file
@@ -25,6 +30,7 @@ print("=" * 80)
 print("\n1. LISTING AVAILABLE CIRCUITS")
 print("-" * 80)
 
+# Parse the collection once; the examples below load circuits from it
 with open(CIRCUITS_FILE, "r") as f:
     import json
 
@@ -40,8 +46,8 @@ print(f"  ... and {len(circuits) - 5} more")
 print("\n\n2. LOADING CIRCUIT BY ID")
 print("-" * 80)
 
-monaco = GeoJSONTrackParser.from_feature_collection_file(
-    CIRCUITS_FILE,
+monaco = GeoJSONTrackParser.from_feature_collection(
+    geojson_data,
     circuit_id="mc-1929",  # Monaco GP
     num_laps=78,  # Actual Monaco GP lap count
 )
@@ -49,7 +55,7 @@ monaco = GeoJSONTrackParser.from_feature_collection_file(
 print(f"\nLoaded: {monaco.name}")
 print(f"  Length: {monaco.length/1000:.2f}km")
 print(
-    f"  Total distance: {monaco.length * monaco.num_laps / 1000:.2f}km ({monaco.num_laps} laps)"
+    f"  Total distance: {monaco.total_distance / 1000:.2f}km ({monaco.num_laps} laps)"
 )
 print(f"  Segments: {len(monaco.segments)}")
 
@@ -57,33 +63,34 @@ print(f"  Segments: {len(monaco.segments)}")
 print("\n\n3. LOADING CIRCUIT BY NAME")
 print("-" * 80)
 
-spa = GeoJSONTrackParser.from_feature_collection_file(
-    CIRCUITS_FILE,
+spa = GeoJSONTrackParser.from_feature_collection(
+    geojson_data,
     circuit_name="Circuit de Spa-Francorchamps",
     num_laps=44,  # Actual Spa GP lap count
 )
 
 print(f"\nLoaded: {spa.name}")
 print(f"  Length: {spa.length/1000:.2f}km")
-print(
-    f"  Total distance: {spa.length * spa.num_laps / 1000:.2f}km ({spa.num_laps} laps)"
-)
+print(f"  Total distance: {spa.total_distance / 1000:.2f}km ({spa.num_laps} laps)")
 print(f"  Segments: {len(spa.segments)}")
 
 # Example 4: Analyze Monaco GP track
 print("\n\n4. TRACK ANALYSIS - MONACO GP")
 print("-" * 80)
 
-monaco_short = GeoJSONTrackParser.from_feature_collection_file(
-    CIRCUITS_FILE, circuit_id="mc-1929", num_laps=1
+monaco_short = GeoJSONTrackParser.from_feature_collection(
+    geojson_data, circuit_id="mc-1929", num_laps=1
 )
 
-# Count different segment types
-left_turns = sum(1 for seg in monaco_short.segments if seg.segment_type == "left_turn")
-right_turns = sum(
-    1 for seg in monaco_short.segments if seg.segment_type == "right_turn"
+# Count different segment types in one pass over the type codes
+monaco_arrays = monaco_short.get_segment_arrays()
+type_counts = np.bincount(
+    monaco_arrays.type_codes[monaco_arrays.type_codes >= 0],
+    minlength=len(SegmentType),
 )
-straights = sum(1 for seg in monaco_short.segments if seg.segment_type == "straight")
+left_turns = type_counts[SegmentType.LEFT_TURN]
+right_turns = type_counts[SegmentType.RIGHT_TURN]
+straights = type_counts[SegmentType.STRAIGHT]
 
 print(f"\n{monaco_short.name} Track Breakdown:")
 print(f"  Total segments: {len(monaco_short.segments)}")
@@ -91,11 +98,10 @@ print(f"  Left turns: {left_turns}")
 print(f"  Right turns: {right_turns}")
 print(f"  Straight sections: {straights}")
 
-# Find tightest corners
-tight_corners = sorted(
-    [seg for seg in monaco_short.segments if seg.curvature > 0],
-    key=lambda s: s.curvature,
-)[:3]
+# Find tightest corners (stable order, so equal radii keep track order)
+curved = np.flatnonzero(monaco_arrays.curvature > 0)
+tightest = curved[np.argsort(monaco_arrays.curvature[curved], kind="stable")[:3]]
+tight_corners = [monaco_short.segments[i] for i in tightest]
 
 print(f"\n  Tightest 3 Corners:")
 for i, seg in enumerate(tight_corners, 1):
@@ -107,13 +113,10 @@ for i, seg in enumerate(tight_corners, 1):
     )
 
 # Calculate average lap time estimate
-total_time = 0
 base_speed = 100.0  # m/s
-for seg in monaco_short.segments:
-    max_speed = seg.get_recommended_speed(base_speed=base_speed)
-    if max_speed > 0:
-        time = seg.length / max_speed
-        total_time += time
+segment_speeds = monaco_short.get_recommended_speeds(base_speed)
+moving = segment_speeds > 0
+total_time = np.sum(monaco_arrays.lengths[moving] / segment_speeds[moving])
 
 print(
     f"\n  Estimated lap time (at speed limits): {total_time:.1f}s ({total_time/60:.2f} minutes)"
@@ -134,14 +137,14 @@ print(f"\n{'Circuit':<40} {'Length':<12} {'Segments':<10} {'Corners':<10}")
 print("-" * 80)
 
 for circuit_id, circuit_name in comparison_circuits:
-    track = GeoJSONTrackParser.from_feature_collection_file(
-        CIRCUITS_FILE, circuit_id=circuit_id, num_laps=1
+    track = GeoJSONTrackParser.from_feature_collection(
+        geojson_data, circuit_id=circuit_id, num_laps=1
     )
 
-    corners = sum(
-        1 for seg in track.segments if seg.segment_type in ["left_turn", "right_turn"]
-    )
-    straights = sum(1 for seg in track.segments if seg.segment_type == "straight")
+    type_codes = track.get_segment_arrays().type_codes
+    type_counts = np.bincount(type_codes[type_codes >= 0], minlength=len(SegmentType))
+    corners = type_counts[SegmentType.LEFT_TURN] + type_counts[SegmentType.RIGHT_TURN]
+    straights = type_counts[SegmentType.STRAIGHT]
 
     print(
         f"{track.name:<40} "
@@ -154,16 +157,36 @@ for circuit_id, circuit_name in comparison_circuits:
 print("\n\n6. DETAILED TRACK PROFILE - SPA-FRANCORCHAMPS")
 print("-" * 80)
 
-# Get detailed segment information
-corner_segments = [
-    seg for seg in spa.segments if seg.segment_type in ["left_turn", "right_turn"]
-]
-straight_segments = [seg for seg in spa.segments if seg.segment_type == "straight"]
-
-# Find tightest corners (smallest radius)
-tight_corners = sorted(
-    [seg for seg in corner_segments if seg.curvature > 0], key=lambda s: s.curvature
-)[:5]
+# Walk the segments once, keeping the tightest corners and longest straights
+# in fixed-size heaps alongside the elevation totals
+tight_heap = []  # (-radius, -index, segment): root is the widest kept corner
+straight_heap = []  # (length, -index, segment): root is the shortest kept
+elevation_gain = 0
+elevation_loss = 0
+
+for index, seg in enumerate(spa.segments):
+    if seg.segment_type in ("left_turn", "right_turn"):
+        if seg.curvature > 0:
+            entry = (-seg.curvature, -index, seg)
+            if len(tight_heap) < 5:
+                heapq.heappush(tight_heap, entry)
+            else:
+                heapq.heappushpop(tight_heap, entry)
+    elif seg.segment_type == "straight":
+        entry = (seg.length, -index, seg)
+        if len(straight_heap) < 3:
+            heapq.heappush(straight_heap, entry)
+        else:
+            heapq.heappushpop(straight_heap, entry)
+
+    if seg.elevation_change > 0:
+        elevation_gain += seg.elevation_change
+    elif seg.elevation_change < 0:
+        elevation_loss += abs(seg.elevation_change)
+
+# Smallest radius first (and longest straight first); ties keep track order
+tight_corners = [entry[2] for entry in sorted(tight_heap, reverse=True)]
+long_straights = [entry[2] for entry in sorted(straight_heap, reverse=True)]
 
 print(f"\nTop 5 Tightest Corners:")
 for i, seg in enumerate(tight_corners, 1):
@@ -174,21 +197,10 @@ for i, seg in enumerate(tight_corners, 1):
         f"Recommended speed: {max_speed:.1f} m/s"
     )
 
-# Find longest straights
-long_straights = sorted(straight_segments, key=lambda s: s.length, reverse=True)[:3]
-
 print(f"\nTop 3 Longest Straights:")
 for i, seg in enumerate(long_straights, 1):
     print(f"  {i}. {seg.length:.1f}m")
 
-# Calculate elevation changes
-elevation_gain = sum(
-    seg.elevation_change for seg in spa.segments if seg.elevation_change > 0
-)
-elevation_loss = sum(
-    abs(seg.elevation_change) for seg in spa.segments if seg.elevation_change < 0
-)
-
 print(f"\nElevation Profile:")
 print(f"  Total climb: {elevation_gain:.1f}m")
 print(f"  Total descent: {elevation_loss:.1f}m")
@@ -142,11 +142,15 @@ print("=" * 80)
 
 finished = sim.leaderboard.get_finished_agents()
 if finished:
+    # Leaderboard entries only carry ids, so join back to agents through a dict
+    agents_by_id = {agent.unique_id: agent for agent in sim.agents_list}
+
     winner = finished[0]
     print(f"\n🥇 WINNER: {winner['name']}")
     print(f"   Total Time: {winner['total_time']:.2f}s")
-    if winner.get("agent"):
-        state = winner["agent"].get_state()
+    winner_agent = agents_by_id.get(winner["id"])
+    if winner_agent:
+        state = winner_agent.get_state()
         print(f"   Final Energy: {state.get('energy', 'N/A')}%")
         print(f"   Tire Wear: {state.get('tire_wear', 'N/A')}%")
         print(f"   Pit Stops: {state.get('pit_stops', 'N/A')}")
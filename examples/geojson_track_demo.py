@@ -48,13 +48,14 @@ if os.path.exists(monaco_path):
     print("\n  Track Profile (first 10 segments):")
     print(f"  {'Segment':<12} {'Type':<15} {'Length (m)':<12} {'Curvature (m)':<15}")
     print("  " + "-" * 70)
-    for i, seg in enumerate(monaco.segments[:10]):
-        seg_dict = seg.to_dict()
+    for seg in monaco.segments[:10]:
+        # Read attributes directly rather than building a to_dict() per row;
+        # values are rounded the same way to_dict() does
         print(
-            f"  {seg_dict['id']:<12} "
-            f"{seg_dict['type']:<15} "
-            f"{seg_dict['length']:<12.1f} "
-            f"{seg_dict['curvature']:<15.1f}"
+            f"  {seg.id:<12} "
+            f"{seg.segment_type:<15} "
+            f"{round(seg.length, 2):<12.1f} "
+            f"{round(seg.curvature, 2):<15.1f}"
         )
 
     # Create simulation
@@ -204,12 +205,10 @@ print(f"  Segments: {len(custom_track.segments)}")
 print("\n  Position to Coordinate mapping (every 100m):")
 print(f"  {'Distance (m)':<15} {'X (m)':<15} {'Y (m)':<15} {'Z (m)':<15}")
 print("  " + "-" * 60)
-for dist in range(
-    0, int(custom_track.length) + 1, max(1, int(custom_track.length / 5))
-):
-    coords = custom_track.get_coordinates_at_position(dist)
-    if coords:
-        print(f"  {dist:<15.1f} {coords.x:<15.2f} {coords.y:<15.2f} {coords.z:<15.2f}")
+distances = range(0, int(custom_track.length) + 1, max(1, int(custom_track.length / 5)))
+coords = custom_track.get_coordinates_at_positions(distances)
+for dist, (x, y, z) in zip(distances, coords):
+    print(f"  {dist:<15.1f} {x:<15.2f} {y:<15.2f} {z:<15.2f}")
 
 print("\n" + "=" * 100)
 print("GEOJSON IMPORT COMPLETE!")
@@ -10,6 +10,10 @@ circuits = {
     "Suzuka": F1TrackLibrary.suzuka(),
 }
 
+# Gather track info once; both the comparison table and the difficulty
+# analysis below read from it
+infos = {name: track.get_info() for name, track in circuits.items()}
+
 print("=" * 100)
 print("F1 CIRCUIT COMPARISON")
 print("=" * 100)
@@ -20,8 +24,7 @@ print(
 )
 print("-" * 100)
 
-for name, track in circuits.items():
-    info = track.get_info()
+for name, info in infos.items():
     print(
         f"{name:<25} "
         f"{info['length']/1000:<15.3f} "
@@ -126,15 +129,14 @@ print("\n" + "=" * 100)
 print("DIFFICULTY FACTORS")
 print("=" * 100)
 
-for name, track in circuits.items():
-    info = track.get_info()
+for name, info in infos.items():
     corners = info.get("corners", 0)
     elevation = info.get("elevation_gain", 0) + info.get("elevation_loss", 0)
-    length = info["length"]
+    per_km = 1000 / info["length"]
 
     # Simple difficulty score
-    corner_density = (corners / length) * 1000  # corners per km
-    elevation_factor = elevation / length * 1000
+    corner_density = corners * per_km  # corners per km
+    elevation_factor = elevation * per_km
     difficulty = corner_density * 2 + elevation_factor
 
     print(f"\n{name}:")
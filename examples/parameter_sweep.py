@@ -0,0 +1,28 @@
+"""Example: Sweep cornering skill across parallel simulations."""
+
+from shifters.config.scenarios import DRONE_RACING
+from shifters.simcore.batch import run_batch, sweep_configs
+
+
+def main():
+    # One drone race per cornering skill value, each in its own process
+    configs = sweep_configs(DRONE_RACING, "cornering_skill", [0.8, 0.9, 1.0, 1.1, 1.2])
+    results = run_batch(configs, max_steps=2000)
+
+    print("=" * 80)
+    print("CORNERING SKILL SWEEP")
+    print("=" * 80)
+    print(f"\n{'Scenario':<50} {'Leader':<15} {'Progress':<10}")
+    print("-" * 80)
+
+    for result in results:
+        leader = result["standings"][0] if result["standings"] else None
+        print(
+            f"{result['scenario']:<50} "
+            f"{leader['name'] if leader else '-':<15} "
+            f"{leader['progress'] if leader else 0.0:<10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -40,8 +40,8 @@ test_circuits = [
 for circuit_id, expected_name in test_circuits:
     print(f"\nLoading: {expected_name} ({circuit_id})")
     try:
-        track = GeoJSONTrackParser.from_feature_collection_file(
-            circuits_file, circuit_id=circuit_id, num_laps=10
+        track = GeoJSONTrackParser.from_feature_collection(
+            geojson_data, circuit_id=circuit_id, num_laps=10
         )
 
         print(f"  ✓ Successfully loaded!")
@@ -49,13 +49,7 @@ for circuit_id, expected_name in test_circuits:
         print(f"  ✓ Length: {track.length:.2f}m ({track.length/1000:.2f}km)")
         print(f"  ✓ Segments: {len(track.segments)}")
 
-        # Count corners
-        corners = sum(
-            1
-            for seg in track.segments
-            if seg.segment_type in ["left_turn", "right_turn"]
-        )
-        print(f"  ✓ Corners: {corners}")
+        print(f"  ✓ Corners: {track.num_corners}")
 
     except Exception as e:
         print(f"  ✗ Failed: {e}")
@@ -65,7 +59,8 @@ print("LOADING ALL CIRCUITS")
 print("=" * 80)
 
 print("\nAttempting to load all circuits...")
-all_tracks = GeoJSONTrackParser.load_all_circuits(circuits_file, num_laps=10)
+# Reuse the collection parsed for the listing above instead of re-reading the file
+all_tracks = GeoJSONTrackParser.load_all_from_collection(geojson_data, num_laps=10)
 
 print(f"\n✓ Successfully loaded {len(all_tracks)}/{len(circuits)} circuits")
 
@@ -74,14 +69,12 @@ print("\n" + "=" * 80)
 print("CIRCUIT STATISTICS")
 print("=" * 80)
 
-for circuit_id, track in sorted(all_tracks.items()):
-    corners = sum(
-        1 for seg in track.segments if seg.segment_type in ["left_turn", "right_turn"]
-    )
+for circuit_id in sorted(all_tracks):
+    track = all_tracks[circuit_id]
     print(f"\n{track.name}:")
     print(f"  Length: {track.length/1000:.3f}km")
     print(f"  Segments: {len(track.segments)}")
-    print(f"  Corners: {corners}")
+    print(f"  Corners: {track.num_corners}")
 
 print("\n" + "=" * 80)
 print("TEST COMPLETE")
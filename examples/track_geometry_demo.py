@@ -29,9 +29,11 @@ print(
 )
 print("-" * 80)
 
+# Format the table rows first and write them out in one call
+rows = []
 for segment in spa.segments:
     seg_info = segment.to_dict()
-    print(
+    rows.append(
         f"{seg_info['name'] or seg_info['id']:<30} "
         f"{seg_info['type']:<12} "
         f"{seg_info['length']:<10.0f} "
@@ -39,6 +41,7 @@ for segment in spa.segments:
         f"{seg_info['banking']:<10.1f} "
         f"{seg_info['elevation_change']:<12.1f}"
     )
+print("\n".join(rows))
 
 # Famous corners analysis
 print("\n" + "=" * 80)
@@ -52,9 +55,13 @@ famous_corners = [
     ("Blanchimont", "High-speed left kink"),
 ]
 
+# Lowercase the segment names once, in track order, for the lookups below
+named_segments = [(s.name.lower(), s) for s in spa.segments if s.name]
+
 for corner_name, description in famous_corners:
+    wanted = corner_name.lower()
     corner_segment = next(
-        (s for s in spa.segments if s.name and corner_name.lower() in s.name.lower()),
+        (seg for name, seg in named_segments if wanted in name),
         None,
     )
     if corner_segment:
@@ -77,18 +84,21 @@ print("=" * 80)
 print(f"\n{'Distance':<12} {'Elevation':<12} {'Banking':<12} {'Curvature':<12}")
 print("-" * 80)
 
-for distance in range(0, int(spa.length) + 1, 1000):
-    elevation = spa.get_elevation_at_position(distance)
-    banking = spa.get_banking_at_position(distance)
-    curvature = spa.get_curvature_at_position(distance)
-    coords = spa.get_coordinates_at_position(distance)
+# Sample the whole profile in one vectorized lookup
+distances = range(0, int(spa.length) + 1, 1000)
+elevations, bankings, curvatures = spa.profile_at(distances)
 
-    print(
+print(
+    "\n".join(
         f"{distance:<12.0f} "
         f"{elevation:<12.1f} "
         f"{banking:<12.1f} "
         f"{curvature:<12.0f}"
+        for distance, elevation, banking, curvature in zip(
+            distances, elevations, bankings, curvatures
+        )
     )
+)
 
 # Checkpoints
 print("\n" + "=" * 80)
@@ -4,20 +4,28 @@ Shifters - Competitive Mobility Systems Simulator
 A lightweight mobility event simulator for racing, drones, and traffic management.
 """
 
+import importlib
+
 __version__ = "0.1.0"
 
-from shifters.agents.base_agent import MobilityAgent, RacingVehicle
-from shifters.environment.track import (
-    Track,
-    Environment,
-    Checkpoint,
-    Point3D,
-    TrackSegment,
-)
-from shifters.environment.track_builder import TrackBuilder, F1TrackLibrary
-from shifters.environment.geojson_parser import GeoJSONTrackParser
-from shifters.simcore.simulator import MobilitySimulation
-from shifters.leaderboard.leaderboard import Leaderboard, AgentRanking
+# Public names and the modules that define them. They are imported on first
+# access (PEP 562), so ``import shifters`` does not pull in mesa up front.
+_LAZY_IMPORTS = {
+    "MobilityAgent": "shifters.agents.base_agent",
+    "RacingVehicle": "shifters.agents.base_agent",
+    "Track": "shifters.environment.track",
+    "Environment": "shifters.environment.track",
+    "Checkpoint": "shifters.environment.track",
+    "Point3D": "shifters.environment.track",
+    "TrackSegment": "shifters.environment.track",
+    "SegmentType": "shifters.environment.track",
+    "TrackBuilder": "shifters.environment.track_builder",
+    "F1TrackLibrary": "shifters.environment.track_builder",
+    "GeoJSONTrackParser": "shifters.environment.geojson_parser",
+    "MobilitySimulation": "shifters.simcore.simulator",
+    "Leaderboard": "shifters.leaderboard.leaderboard",
+    "AgentRanking": "shifters.leaderboard.leaderboard",
+}
 
 __all__ = [
     "MobilityAgent",
@@ -27,6 +35,7 @@ __all__ = [
     "Checkpoint",
     "Point3D",
     "TrackSegment",
+    "SegmentType",
     "TrackBuilder",
     "F1TrackLibrary",
     "GeoJSONTrackParser",
@@ -34,3 +43,15 @@ __all__ = [
     "Leaderboard",
     "AgentRanking",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,12 +2,22 @@
 
 from typing import Optional, Dict, Any, TYPE_CHECKING
 from mesa import Agent
-import uuid
+import bisect
 import math
+import random
 
 if TYPE_CHECKING:
     from shifters.environment.track import Point3D
 
+# Grip multiplier per weather condition; anything else has full grip
+_WEATHER_GRIP = {
+    "rain": 0.7,  # 30% less grip in rain
+    "wet": 0.85,  # 15% less grip on wet track
+}
+
+# Gap to the car ahead (meters) within which a car is in its slipstream
+_SLIPSTREAM_DISTANCE = 50.0
+
 
 class MobilityAgent(Agent):
     """
@@ -57,16 +67,39 @@ class MobilityAgent(Agent):
         self.elevation = 0.0
         self.current_banking = 0.0
         self.current_curvature = 0.0
+        self.current_segment = None
+        self._geometry_position: Optional[float] = None
 
         # Performance tracking
         self.distance_traveled = 0.0
         self.checkpoints_passed = []
         self.lap_times = []
+        self.lap_times_total = 0.0  # Running sum of lap_times
+        self.best_lap_time: Optional[float] = None
         self.total_time = 0.0
 
         # Store additional properties
         self.properties = kwargs
 
+        # Simulation settings read on every step
+        self._bind_model()
+
+    def _bind_model(self):
+        """
+        Cache the model's time step and environment for the step methods.
+
+        MobilitySimulation calls this again whenever its time_step or
+        environment is reassigned.
+        """
+        self._dt = getattr(self.model, "time_step", 0.1)
+        self._environment = getattr(self.model, "environment", None)
+
+    @property
+    def _track(self):
+        """Track of the bound environment, read live so track swaps apply."""
+        environment = self._environment
+        return environment.track if environment is not None else None
+
     def step(self):
         """
         Execute one step of the agent's behavior.
@@ -80,41 +113,54 @@ class MobilityAgent(Agent):
 
     def _update_track_geometry(self):
         """Update agent's track geometry information from current position."""
-        if hasattr(self.model, "environment") and self.model.environment.track:
-            track = self.model.environment.track
-            self.coordinates = track.get_coordinates_at_position(self.position)
-            self.elevation = track.get_elevation_at_position(self.position)
-            self.current_banking = track.get_banking_at_position(self.position)
-            self.current_curvature = track.get_curvature_at_position(self.position)
+        track = self._track
+        if track is not None:
+            # One combined lookup instead of separate coordinate, elevation,
+            # banking and curvature queries
+            segment, coordinates = track.get_geometry_at_position(self.position)
+            self.coordinates = coordinates
+            self.elevation = coordinates.z if coordinates else 0.0
+            self.current_banking = segment.banking if segment else 0.0
+            self.current_curvature = segment.curvature if segment else 0.0
+            self.current_segment = segment
+            self._geometry_position = self.position
 
     def _calculate_target_speed(self):
         """Calculate target speed based on track geometry."""
-        if hasattr(self.model, "environment") and self.model.environment.track:
-            track = self.model.environment.track
-            self.target_speed = track.get_recommended_speed_at_position(
-                self.position, self.max_speed
+        track = self._track
+        if track is not None:
+            # Reuse the segment found by _update_track_geometry() this step
+            if self._geometry_position == self.position:
+                segment = self.current_segment
+            else:
+                segment = track.get_segment_at_position(self.position)
+            self.target_speed = (
+                segment.get_recommended_speed(self.max_speed)
+                if segment
+                else self.max_speed
             )
         else:
             self.target_speed = self.max_speed
 
     def _accelerate(self):
         """Accelerate or brake to reach target speed."""
-        time_step = getattr(self.model, "time_step", 0.1)
+        time_step = self._dt
+        target_speed = self.target_speed
 
-        if self.speed < self.target_speed:
+        # Clamp to the target with conditional expressions rather than
+        # min()/max() calls; ties resolve the same way as the builtins
+        if self.speed < target_speed:
             # Accelerate
-            self.speed = min(
-                self.speed + self.acceleration * time_step, self.target_speed
-            )
-        elif self.speed > self.target_speed:
+            speed = self.speed + self.acceleration * time_step
+            self.speed = target_speed if target_speed < speed else speed
+        elif self.speed > target_speed:
             # Brake
-            self.speed = max(
-                self.speed - self.braking_rate * time_step, self.target_speed
-            )
+            speed = self.speed - self.braking_rate * time_step
+            self.speed = target_speed if target_speed > speed else speed
 
     def _move(self):
         """Update position based on current speed."""
-        time_step = getattr(self.model, "time_step", 0.1)
+        time_step = self._dt
         movement = self.speed * time_step
         self.position += movement
         self.distance_traveled += movement
@@ -129,6 +175,9 @@ class MobilityAgent(Agent):
         """Record lap completion."""
         self.lap += 1
         self.lap_times.append(lap_time)
+        self.lap_times_total += lap_time
+        if self.best_lap_time is None or lap_time < self.best_lap_time:
+            self.best_lap_time = lap_time
         self.position = 0.0  # Reset position for new lap
 
     def finish_race(self):
@@ -137,8 +186,8 @@ class MobilityAgent(Agent):
 
     def get_state(self) -> Dict[str, Any]:
         """Get current agent state for display/logging."""
-        # Calculate best lap time if any laps completed
-        best_lap = min(self.lap_times) if self.lap_times else None
+        # Best lap is tracked as laps complete
+        best_lap = self.best_lap_time
 
         state = {
             "id": self.unique_id,
@@ -276,28 +325,20 @@ class RacingVehicle(MobilityAgent):
         """Calculate target speed with cornering skill, downforce, and weather."""
         super()._calculate_target_speed()
         
-        # Get weather conditions
-        weather = getattr(self.model.environment, 'weather', 'clear') if hasattr(self.model, 'environment') else 'clear'
-        track_temp = getattr(self.model.environment, 'temperature', 25.0) if hasattr(self.model, 'environment') else 25.0
-        
-        # Weather effects on grip
-        grip_multiplier = 1.0
-        if weather == 'rain':
-            grip_multiplier = 0.7  # 30% less grip in rain
-        elif weather == 'wet':
-            grip_multiplier = 0.85  # 15% less grip on wet track
-        
-        # Tire temperature effects (optimal: 80-100°C)
-        tire_temp_factor = 1.0
-        if self.tire_temperature < 60:
-            tire_temp_factor = 0.9  # Cold tires
-        elif self.tire_temperature > 110:
-            tire_temp_factor = 0.85  # Overheated tires
-        
-        grip_multiplier *= tire_temp_factor
-        
         # Downforce increases cornering speed at high speeds
         if self.current_curvature > 0:
+            # Grip only matters in corners, so weather (read live, the UI can
+            # change it mid-race) and tire temperature are only checked here
+            environment = self._environment
+            weather = environment.weather if environment is not None else 'clear'
+            grip_multiplier = _WEATHER_GRIP.get(weather, 1.0)
+            
+            # Tire temperature effects (optimal: 80-100°C)
+            if self.tire_temperature < 60:
+                grip_multiplier *= 0.9  # Cold tires
+            elif self.tire_temperature > 110:
+                grip_multiplier *= 0.85  # Overheated tires
+            
             # Base cornering skill
             skill_factor = self.cornering_skill * grip_multiplier
             
@@ -553,8 +594,7 @@ class RacingVehicle(MobilityAgent):
 
     def _move(self):
         """Move with advanced physics: drag, downforce, slipstream, energy, tire wear."""
-        import random
-        time_step = getattr(self.model, "time_step", 0.1)
+        time_step = self._dt
         
         # Add lap-time variability (driver consistency)
         # This creates natural variation that enables overtaking
@@ -659,11 +699,16 @@ class RacingVehicle(MobilityAgent):
         
         # Normalize position continuously for circuit tracks to prevent visual jumps
         self.just_crossed_line = False
-        if hasattr(self.model, 'environment') and hasattr(self.model.environment, 'track'):
-            track = self.model.environment.track
-            if track.track_type == "circuit" and self.position >= track.length:
-                self.position = self.position % track.length
-                self.just_crossed_line = True  # Mark that we crossed the finish line
+        # Positions wrap on circuits only. The track and its length are read
+        # live; adding segments to the track changes the length
+        track = self._track
+        if (
+            track is not None
+            and track.track_type == "circuit"
+            and self.position >= track.length
+        ):
+            self.position = self.position % track.length
+            self.just_crossed_line = True  # Mark that we crossed the finish line
         
         # Energy consumption (speed, acceleration, and drag)
         speed_factor = self.speed / self.max_speed
@@ -687,8 +732,9 @@ class RacingVehicle(MobilityAgent):
             self.tire_wear = min(100.0, self.tire_wear + brake_wear)
         
         # Tire temperature management
-        weather = getattr(self.model.environment, 'weather', 'clear') if hasattr(self.model, 'environment') else 'clear'
-        ambient_temp = getattr(self.model.environment, 'temperature', 25.0) if hasattr(self.model, 'environment') else 25.0
+        environment = self._environment
+        weather = environment.weather if environment is not None else 'clear'
+        ambient_temp = environment.temperature if environment is not None else 25.0
         
         # Tires heat up with use
         if self.speed > 0:
@@ -710,7 +756,6 @@ class RacingVehicle(MobilityAgent):
         
         # Damage accumulation (random events, hard cornering)
         if self.current_curvature > 0 and self.speed > self.max_speed * 0.9:
-            import random
             if random.random() < 0.0001:  # 0.01% chance per step
                 self.damage_level = min(100.0, self.damage_level + random.uniform(1, 5))
 
@@ -726,18 +771,45 @@ class RacingVehicle(MobilityAgent):
     def check_slipstream(self, other_agents: list):
         """Check if this vehicle is in slipstream of another."""
         self.in_slipstream = False
-        slipstream_distance = 50.0  # meters
         
         for agent in other_agents:
             if agent.unique_id != self.unique_id:
                 # Check if agent is ahead and within slipstream range
                 distance_ahead = agent.position - self.position
-                if 0 < distance_ahead < slipstream_distance:
+                if 0 < distance_ahead < _SLIPSTREAM_DISTANCE:
                     # Check if on same lap
                     if agent.lap == self.lap:
                         self.in_slipstream = True
                         break
     
+    @staticmethod
+    def update_slipstream(vehicles: list):
+        """
+        Update in_slipstream for every active vehicle in one sorted sweep.
+
+        Same result as calling check_slipstream(vehicles) on each unfinished
+        vehicle, without comparing every pair. Once vehicles are sorted by
+        (lap, position), the nearest car ahead on the same lap is the next
+        key above a vehicle's own.
+
+        Args:
+            vehicles: All RacingVehicles in the race (finished ones still
+                count as cars to follow)
+        """
+        keys = sorted((agent.lap, agent.position) for agent in vehicles)
+        count = len(keys)
+        
+        for agent in vehicles:
+            if not agent.finished:
+                lap = agent.lap
+                position = agent.position
+                index = bisect.bisect_right(keys, (lap, position))
+                agent.in_slipstream = (
+                    index < count
+                    and keys[index][0] == lap
+                    and keys[index][1] - position < _SLIPSTREAM_DISTANCE
+                )
+    
     def can_overtake(self, car_ahead, overtaking_threshold: float = 1.2) -> bool:
         """
         Check if this car can overtake the car ahead based on F1-metrics model.
@@ -780,16 +852,14 @@ class RacingVehicle(MobilityAgent):
         - 90% within 4s
         - Heavy tail for problem stops
         """
-        import numpy as np
-        
         # Log-logistic distribution parameters (fitted to F1 data)
         # alpha (scale) and beta (shape) chosen to match F1 pit-stop distribution
         alpha = 0.8  # Scale parameter
         beta = 3.0   # Shape parameter (controls tail heaviness)
         
         # Generate random pit-stop delay using log-logistic distribution
-        u = np.random.uniform(0, 1)
-        pit_delay = alpha * ((u / (1 - u)) ** (1 / beta))
+        u = random.random()
+        pit_delay = alpha * math.pow(u / (1 - u), 1 / beta)
         
         # Total pit time = base time + random delay
         actual_pit_duration = base_pit_duration + pit_delay
@@ -1,6 +1,6 @@
 """Pre-configured scenarios for different mobility events."""
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 
 
@@ -17,6 +17,7 @@ class ScenarioConfig:
     agent_type: str
     agent_params: Dict[str, Any]
     time_step: float = 0.1
+    seed: Optional[int] = None  # Seeds the random module for repeatable runs
 
 
 # Formula E Scenario
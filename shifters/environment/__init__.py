@@ -1,6 +1,12 @@
 """Environment module for track and safety car systems."""
 
-from shifters.environment.track import Track, Environment, TrackSegment, Point3D
+from shifters.environment.track import (
+    Track,
+    Environment,
+    TrackSegment,
+    Point3D,
+    SegmentType,
+)
 from shifters.environment.safety_car import SafetyCar, DNFManager
 from shifters.environment.geojson_parser import GeoJSONTrackParser
 
@@ -9,6 +15,7 @@ __all__ = [
     "Environment",
     "TrackSegment",
     "Point3D",
+    "SegmentType",
     "SafetyCar",
     "DNFManager",
     "GeoJSONTrackParser",
@@ -1,10 +1,62 @@
 """GeoJSON parser for importing real racing circuit data."""
 
 from typing import List, Dict, Any, Optional, Tuple
+import functools
 import json
 import math
+import os
 from shifters.environment.track import Track, TrackSegment, Point3D, Checkpoint
 
+try:
+    import orjson
+except ImportError:  # optional: faster parsing of large GeoJSON files
+    orjson = None
+
+# Maps a circuit id or name to (feature position, feature)
+FeatureIndex = Dict[Any, Tuple[int, Dict[str, Any]]]
+
+
+def _read_json(filepath: str) -> Any:
+    """Read a JSON file, using orjson when it is installed."""
+    if orjson is not None:
+        with open(filepath, "rb") as f:
+            return orjson.loads(f.read())
+    with open(filepath, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _index_features(geojson_data: Dict[str, Any]) -> Tuple[FeatureIndex, FeatureIndex]:
+    """Index FeatureCollection features by circuit id and name (first match wins)."""
+    by_id: FeatureIndex = {}
+    by_name: FeatureIndex = {}
+    for position, feature in enumerate(geojson_data.get("features", [])):
+        props = feature.get("properties", {})
+        by_id.setdefault(props.get("id"), (position, feature))
+        by_name.setdefault(props.get("Name"), (position, feature))
+    return by_id, by_name
+
+
+@functools.lru_cache(maxsize=4)
+def _load_collection(
+    filepath: str, mtime_ns: int
+) -> Tuple[Dict[str, Any], FeatureIndex, FeatureIndex]:
+    """
+    Parse and index a GeoJSON file.
+
+    Cached per path and modification time, so repeated loads from an unchanged
+    file skip the JSON parse. The returned data is shared and must not be mutated.
+    """
+    geojson_data = _read_json(filepath)
+    return (geojson_data, *_index_features(geojson_data))
+
+
+def _load_collection_file(
+    filepath: str,
+) -> Tuple[Dict[str, Any], FeatureIndex, FeatureIndex]:
+    """Load a GeoJSON file through the parse cache."""
+    path = os.path.abspath(filepath)
+    return _load_collection(path, os.stat(path).st_mtime_ns)
+
 
 class GeoJSONTrackParser:
     """
@@ -255,12 +307,9 @@ class GeoJSONTrackParser:
         Returns:
             Track object
         """
-        with open(filepath, "r", encoding="utf-8") as f:
-            geojson_data = json.load(f)
+        geojson_data = _read_json(filepath)
 
         if track_name is None:
-            import os
-
             track_name = os.path.splitext(os.path.basename(filepath))[0]
 
         return cls.from_geojson(geojson_data, track_name, num_laps, track_width)
@@ -448,6 +497,23 @@ class GeoJSONTrackParser:
 
         return circuits
 
+    @classmethod
+    def list_circuits_in_file(cls, filepath: str) -> List[Dict[str, Any]]:
+        """
+        List all circuits in a FeatureCollection GeoJSON file.
+
+        The parsed file is cached until it changes on disk, so repeated calls
+        only parse it once.
+
+        Args:
+            filepath: Path to GeoJSON file containing FeatureCollection
+
+        Returns:
+            List of circuit info dicts, as from list_circuits_in_collection()
+        """
+        geojson_data, _, _ = _load_collection_file(filepath)
+        return cls.list_circuits_in_collection(geojson_data)
+
     @classmethod
     def from_feature_collection(
         cls,
@@ -477,26 +543,63 @@ class GeoJSONTrackParser:
             # If it's a single Feature, use the regular from_geojson method
             return cls.from_geojson(geojson_data, circuit_name, num_laps, track_width)
 
+        by_id, by_name = _index_features(geojson_data)
+        return cls._from_indexed_collection(
+            geojson_data,
+            by_id,
+            by_name,
+            circuit_id,
+            circuit_name,
+            num_laps,
+            track_width,
+        )
+
+    @classmethod
+    def _from_indexed_collection(
+        cls,
+        geojson_data: Dict[str, Any],
+        by_id: FeatureIndex,
+        by_name: FeatureIndex,
+        circuit_id: Optional[str],
+        circuit_name: Optional[str],
+        num_laps: int,
+        track_width: float,
+    ) -> Track:
+        """
+        Load a circuit from a FeatureCollection using its id/name indexes.
+
+        Args:
+            geojson_data: GeoJSON FeatureCollection data
+            by_id: Features indexed by circuit ID
+            by_name: Features indexed by circuit name
+            circuit_id: Circuit ID to load
+            circuit_name: Circuit name to load
+            num_laps: Number of laps
+            track_width: Track width in meters
+
+        Returns:
+            Track object
+
+        Raises:
+            ValueError: If circuit not found or neither ID nor name provided
+        """
         if circuit_id is None and circuit_name is None:
             raise ValueError("Must provide either circuit_id or circuit_name")
 
-        # Find the matching feature
-        feature = None
-        for f in geojson_data.get("features", []):
-            props = f.get("properties", {})
-
-            if circuit_id and props.get("id") == circuit_id:
-                feature = f
-                break
-            elif circuit_name and props.get("Name") == circuit_name:
-                feature = f
-                break
+        # Find the matching feature (earliest in the collection if both given)
+        id_match = by_id.get(circuit_id) if circuit_id else None
+        name_match = by_name.get(circuit_name) if circuit_name else None
+        if id_match and name_match:
+            match = min(id_match, name_match, key=lambda m: m[0])
+        else:
+            match = id_match or name_match
 
-        if feature is None:
+        if match is None:
             available = cls.list_circuits_in_collection(geojson_data)
             raise ValueError(
                 f"Circuit not found. Available circuits: {[c['name'] for c in available]}"
             )
+        feature = match[1]
 
         # Extract track name from properties
         props = feature.get("properties", {})
@@ -525,6 +628,9 @@ class GeoJSONTrackParser:
         """
         Load a specific circuit from a FeatureCollection GeoJSON file.
 
+        The parsed file is cached until it changes on disk, so loading several
+        circuits from the same file only parses it once.
+
         Args:
             filepath: Path to GeoJSON file containing FeatureCollection
             circuit_id: Circuit ID to load (e.g., "mc-1929" for Monaco)
@@ -535,11 +641,19 @@ class GeoJSONTrackParser:
         Returns:
             Track object
         """
-        with open(filepath, "r", encoding="utf-8") as f:
-            geojson_data = json.load(f)
+        geojson_data, by_id, by_name = _load_collection_file(filepath)
 
-        return cls.from_feature_collection(
-            geojson_data, circuit_id, circuit_name, num_laps, track_width
+        if geojson_data.get("type") != "FeatureCollection":
+            return cls.from_geojson(geojson_data, circuit_name, num_laps, track_width)
+
+        return cls._from_indexed_collection(
+            geojson_data,
+            by_id,
+            by_name,
+            circuit_id,
+            circuit_name,
+            num_laps,
+            track_width,
         )
 
     @classmethod
@@ -560,9 +674,47 @@ class GeoJSONTrackParser:
         Returns:
             Dictionary mapping circuit IDs to Track objects
         """
-        with open(filepath, "r", encoding="utf-8") as f:
-            geojson_data = json.load(f)
+        geojson_data, by_id, by_name = _load_collection_file(filepath)
+        return cls._load_all_indexed(
+            geojson_data, by_id, by_name, num_laps, track_width
+        )
+
+    @classmethod
+    def load_all_from_collection(
+        cls,
+        geojson_data: Dict[str, Any],
+        num_laps: int = 1,
+        track_width: float = 12.0,
+    ) -> Dict[str, Track]:
+        """
+        Load all circuits from already-parsed FeatureCollection data.
+
+        Useful when the collection has been parsed for other purposes (e.g.
+        list_circuits_in_collection), so the file is not read a second time.
+
+        Args:
+            geojson_data: GeoJSON FeatureCollection data
+            num_laps: Number of laps for each track
+            track_width: Track width in meters
+
+        Returns:
+            Dictionary mapping circuit IDs to Track objects
+        """
+        by_id, by_name = _index_features(geojson_data)
+        return cls._load_all_indexed(
+            geojson_data, by_id, by_name, num_laps, track_width
+        )
 
+    @classmethod
+    def _load_all_indexed(
+        cls,
+        geojson_data: Dict[str, Any],
+        by_id: FeatureIndex,
+        by_name: FeatureIndex,
+        num_laps: int,
+        track_width: float,
+    ) -> Dict[str, Track]:
+        """Load every circuit of an indexed FeatureCollection."""
         if geojson_data.get("type") != "FeatureCollection":
             raise ValueError("Expected FeatureCollection")
 
@@ -573,9 +725,12 @@ class GeoJSONTrackParser:
             circuit_name = props.get("Name", circuit_id)
 
             try:
-                track = cls.from_feature_collection(
+                track = cls._from_indexed_collection(
                     geojson_data,
+                    by_id,
+                    by_name,
                     circuit_id=circuit_id,
+                    circuit_name=None,
                     num_laps=num_laps,
                     track_width=track_width,
                 )
@@ -1,8 +1,11 @@
 """Track and environment representation for mobility simulation."""
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple
 from dataclasses import dataclass
+from enum import IntEnum
+import bisect
 import math
+import numpy as np
 
 
 @dataclass
@@ -28,6 +31,39 @@ class Point3D:
         return {"x": self.x, "y": self.y, "z": self.z}
 
 
+class SegmentType(IntEnum):
+    """Integer tags for segment types, used by the array view of a track."""
+
+    STRAIGHT = 0
+    LEFT_TURN = 1
+    RIGHT_TURN = 2
+    CHICANE = 3
+
+
+# Maps TrackSegment.segment_type names to their integer tags
+SEGMENT_TYPE_CODES: Dict[str, SegmentType] = {t.name.lower(): t for t in SegmentType}
+
+# Segment types that count as corners
+_CORNER_TYPES = frozenset({"left_turn", "right_turn", "chicane"})
+
+# Gravitational acceleration (m/s²) for corner speed estimates
+_GRAVITY = 9.81
+
+
+def _surface_friction(surface_type: str) -> float:
+    """Friction coefficient of a track surface for corner speed estimates."""
+    return 1.2 if surface_type == "asphalt" else 0.8
+
+
+def _banking_factor(banking):
+    """
+    Corner speed multiplier for a banking angle (banking helps hold speed).
+
+    Works on a single angle in degrees or on an array of them.
+    """
+    return 1.0 + abs(banking) / 90.0
+
+
 @dataclass
 class TrackSegment:
     """
@@ -65,7 +101,7 @@ class TrackSegment:
 
     def is_corner(self) -> bool:
         """Check if this segment is a corner."""
-        return self.segment_type in ["left_turn", "right_turn", "chicane"]
+        return self.segment_type in _CORNER_TYPES
 
     def get_recommended_speed(self, base_speed: float) -> float:
         """
@@ -84,12 +120,11 @@ class TrackSegment:
         if self.curvature > 0:
             # v = sqrt(μ * g * r) where μ is friction coefficient
             # Simplified: tighter corners (smaller radius) = lower speed
-            friction = 1.2 if self.surface_type == "asphalt" else 0.8
-            gravity = 9.81
+            friction = _surface_friction(self.surface_type)
             # Adjust for banking (banking helps maintain speed in corners)
-            banking_factor = 1.0 + abs(self.banking) / 90.0
+            banking_factor = _banking_factor(self.banking)
             corner_speed = math.sqrt(
-                friction * gravity * self.curvature * banking_factor
+                friction * _GRAVITY * self.curvature * banking_factor
             )
             return min(base_speed, corner_speed)
 
@@ -122,11 +157,30 @@ class Checkpoint:
     coordinates: Optional[Point3D] = None  # Optional 3D location
 
 
+class SegmentArrays(NamedTuple):
+    """Column-wise view of a track's segments, one array entry per segment."""
+
+    starts: np.ndarray  # Distance from track start to the segment start
+    lengths: np.ndarray
+    curvature: np.ndarray
+    banking: np.ndarray
+    elevation_change: np.ndarray
+    type_codes: np.ndarray  # SegmentType tag (-1 = unknown type)
+    start_points: np.ndarray  # (n, 3) array of segment start x, y, z
+    end_points: np.ndarray  # (n, 3) array of segment end x, y, z
+    speed_limits: np.ndarray  # 0.0 where the segment has no speed limit
+    friction: np.ndarray  # Surface friction coefficient
+
+
 class Track:
     """
     Represents a racing track or path for agents to follow.
 
     Can be linear, circular, or have custom 3D geometry with segments.
+
+    Lookups on segments are cached. Appending to or replacing the segments
+    list is picked up automatically; after editing a segment in place
+    (length, curvature, banking, segment_type, ...) call invalidate_caches().
     """
 
     def __init__(
@@ -153,6 +207,12 @@ class Track:
         self.name = name
         self.checkpoints: List[Checkpoint] = []
         self.segments: List[TrackSegment] = segments or []
+        self._segment_arrays: Optional[SegmentArrays] = None
+        self._segment_starts: Optional[List[float]] = None
+        self._geometry_stats: Optional[Dict[str, Any]] = None
+        # Segments list and size the caches above were built from
+        self._cached_segments: Optional[List[TrackSegment]] = None
+        self._cached_segment_count = 0
 
         # If segments are provided, validate and calculate total length
         if self.segments:
@@ -169,6 +229,18 @@ class Track:
         start_coords = self.segments[0].start_point if self.segments else None
         self.add_checkpoint("start_finish", 0.0, "Start/Finish", start_coords)
 
+    @property
+    def total_distance(self) -> float:
+        """Full race distance (track length times number of laps)."""
+        return self.length * self.num_laps
+
+    @property
+    def num_corners(self) -> int:
+        """Number of corner segments (cached with the other geometry stats)."""
+        if not self.segments:
+            return 0
+        return self._get_geometry_stats()["corners"]
+
     def _validate_segments(self):
         """Validate that segments are properly connected."""
         if not self.segments:
@@ -203,7 +275,130 @@ class Track:
             segment: TrackSegment to add
         """
         self.segments.append(segment)
-        self.length = sum(seg.length for seg in self.segments)
+        self.invalidate_caches()
+
+    def invalidate_caches(self):
+        """
+        Recompute the length and drop the caches built from the segments.
+
+        Call this after editing a segment in place. Changes to the segments
+        list itself are detected without it.
+        """
+        if self.segments:
+            self.length = sum(seg.length for seg in self.segments)
+        self._segment_arrays = None
+        self._segment_starts = None
+        self._geometry_stats = None
+        self._cached_segments = self.segments
+        self._cached_segment_count = len(self.segments)
+
+    def _sync_segment_caches(self):
+        """
+        Drop the segment-derived caches if the segments list has changed.
+
+        segments is public and can be appended to or replaced directly (a
+        TrackBuilder shares its list with the tracks it builds), so the caches
+        are keyed on the list and its length rather than cleared only by
+        add_segment(). Edits inside a segment are not visible here; see
+        invalidate_caches().
+        """
+        segments = self.segments
+        if (
+            segments is not self._cached_segments
+            or len(segments) != self._cached_segment_count
+        ):
+            self._segment_arrays = None
+            self._segment_starts = None
+            self._geometry_stats = None
+            self._cached_segments = segments
+            self._cached_segment_count = len(segments)
+
+    def get_segment_arrays(self) -> SegmentArrays:
+        """
+        Get segment properties as NumPy arrays for bulk queries.
+
+        The arrays are built on first use and cached until the segments list
+        changes.
+
+        Returns:
+            SegmentArrays with one entry per segment
+        """
+        self._sync_segment_caches()
+        if self._segment_arrays is None:
+            segments = self.segments
+            lengths = np.array([seg.length for seg in segments], dtype=np.float64)
+            starts = np.zeros(len(segments), dtype=np.float64)
+            np.cumsum(lengths[:-1], out=starts[1:])
+
+            self._segment_arrays = SegmentArrays(
+                starts=starts,
+                lengths=lengths,
+                curvature=np.array(
+                    [seg.curvature for seg in segments], dtype=np.float64
+                ),
+                banking=np.array([seg.banking for seg in segments], dtype=np.float64),
+                elevation_change=np.array(
+                    [seg.elevation_change for seg in segments], dtype=np.float64
+                ),
+                type_codes=np.array(
+                    [SEGMENT_TYPE_CODES.get(seg.segment_type, -1) for seg in segments],
+                    dtype=np.int8,
+                ),
+                start_points=np.array(
+                    [
+                        (seg.start_point.x, seg.start_point.y, seg.start_point.z)
+                        for seg in segments
+                    ],
+                    dtype=np.float64,
+                ).reshape(-1, 3),
+                end_points=np.array(
+                    [
+                        (seg.end_point.x, seg.end_point.y, seg.end_point.z)
+                        for seg in segments
+                    ],
+                    dtype=np.float64,
+                ).reshape(-1, 3),
+                speed_limits=np.array(
+                    [seg.speed_limit or 0.0 for seg in segments], dtype=np.float64
+                ),
+                friction=np.array(
+                    [_surface_friction(seg.surface_type) for seg in segments],
+                    dtype=np.float64,
+                ),
+            )
+        return self._segment_arrays
+
+    def get_recommended_speeds(self, base_speed: float) -> np.ndarray:
+        """
+        Get the recommended speed for every segment at once.
+
+        Vectorized equivalent of calling TrackSegment.get_recommended_speed()
+        on each segment.
+
+        Args:
+            base_speed: Agent's maximum speed capability
+
+        Returns:
+            Array of recommended speeds, one per segment
+        """
+        arrays = self.get_segment_arrays()
+
+        # v = sqrt(μ * g * r), adjusted for banking; straights keep base speed
+        banking_factor = _banking_factor(arrays.banking)
+        with np.errstate(invalid="ignore"):
+            corner_speed = np.sqrt(
+                arrays.friction * _GRAVITY * arrays.curvature * banking_factor
+            )
+        speeds = np.where(
+            arrays.curvature > 0, np.minimum(base_speed, corner_speed), base_speed
+        )
+
+        # Explicit speed limits take precedence over the physics estimate
+        return np.where(
+            arrays.speed_limits != 0,
+            np.minimum(base_speed, arrays.speed_limits),
+            speeds,
+        )
 
     def get_segment_at_position(self, position: float) -> Optional[TrackSegment]:
         """
@@ -218,14 +413,81 @@ class Track:
         if not self.segments:
             return None
 
-        accumulated = 0.0
-        for segment in self.segments:
-            if accumulated <= position < accumulated + segment.length:
-                return segment
-            accumulated += segment.length
+        return self._segment_for_index(self._find_segment_index(position), position)
+
+    def _find_segment_index(self, position: float) -> int:
+        """
+        Find the segment containing a position with a binary search.
+
+        Args:
+            position: Distance from start of track
+
+        Returns:
+            Index of the segment with start <= position < end, or -1 if none
+        """
+        self._sync_segment_caches()
+        if self._segment_starts is None:
+            self._segment_starts = self.get_segment_arrays().starts.tolist()
+
+        index = bisect.bisect_right(self._segment_starts, position) - 1
+        if index >= 0:
+            end = self._segment_starts[index] + self.segments[index].length
+            if position < end:
+                return index
+        return -1
+
+    def _segment_for_index(self, index: int, position: float) -> Optional[TrackSegment]:
+        """Resolve a _find_segment_index() result to a segment."""
+        if index >= 0:
+            return self.segments[index]
 
         # Handle edge case: position at or past end of track
-        return self.segments[-1] if position >= accumulated else None
+        track_end = self._segment_starts[-1] + self.segments[-1].length
+        return self.segments[-1] if position >= track_end else None
+
+    def _coordinates_for_index(self, index: int, position: float) -> Point3D:
+        """Resolve a _find_segment_index() result to interpolated coordinates."""
+        if index >= 0:
+            # Interpolate within the segment
+            segment = self.segments[index]
+            segment_progress = (position - self._segment_starts[index]) / segment.length
+            return self._interpolate_point(
+                segment.start_point, segment.end_point, segment_progress
+            )
+
+        # Return end point if we're at the very end
+        return self.segments[-1].end_point
+
+    def get_geometry_at_position(
+        self, position: float
+    ) -> Tuple[Optional[TrackSegment], Optional[Point3D]]:
+        """
+        Get the segment and 3D coordinates at a position together.
+
+        Same results as get_segment_at_position() and
+        get_coordinates_at_position(), sharing one segment search when the
+        position needs no wrapping.
+
+        Args:
+            position: Distance from start of track
+
+        Returns:
+            Tuple of (segment, coordinates), both None if track has no geometry
+        """
+        if not self.segments:
+            return None, None
+
+        index = self._find_segment_index(position)
+        segment = self._segment_for_index(index, position)
+
+        # Coordinates wrap around circuit tracks; segment lookups do not
+        if self.track_type == "circuit":
+            wrapped = position % self.length
+            if wrapped != position:
+                position = wrapped
+                index = self._find_segment_index(position)
+
+        return segment, self._coordinates_for_index(index, position)
 
     def get_coordinates_at_position(self, position: float) -> Optional[Point3D]:
         """
@@ -244,19 +506,48 @@ class Track:
         if self.track_type == "circuit":
             position = position % self.length
 
-        accumulated = 0.0
-        for segment in self.segments:
-            segment_end = accumulated + segment.length
-            if accumulated <= position < segment_end:
-                # Interpolate within the segment
-                segment_progress = (position - accumulated) / segment.length
-                return self._interpolate_point(
-                    segment.start_point, segment.end_point, segment_progress
-                )
-            accumulated += segment.length
+        return self._coordinates_for_index(self._find_segment_index(position), position)
 
-        # Return end point if we're at the very end
-        return self.segments[-1].end_point if self.segments else None
+    def get_coordinates_at_positions(self, positions) -> Optional[np.ndarray]:
+        """
+        Get 3D coordinates for many positions along the track at once.
+
+        Vectorized equivalent of get_coordinates_at_position().
+
+        Args:
+            positions: Sequence or array of distances from start of track
+
+        Returns:
+            Array of shape (n, 3) with x, y, z per position, or None if track
+            has no geometry
+        """
+        if not self.segments:
+            return None
+
+        arrays = self.get_segment_arrays()
+        positions = np.asarray(positions, dtype=np.float64)
+
+        # Normalize position for circuit tracks
+        if self.track_type == "circuit":
+            positions = np.mod(positions, self.length)
+
+        # Last segment starting at or before each position; positions that fall
+        # outside every segment get the track's end point, as in the scalar path
+        index = np.searchsorted(arrays.starts, positions, side="right") - 1
+        safe_index = np.maximum(index, 0)
+        starts = arrays.starts[safe_index]
+        lengths = arrays.lengths[safe_index]
+        inside = (index >= 0) & (positions < starts + lengths)
+
+        coords = np.empty((positions.size, 3), dtype=np.float64)
+        coords[:] = arrays.end_points[-1]
+        if inside.any():
+            seg_index = safe_index[inside]
+            progress = (positions[inside] - starts[inside]) / lengths[inside]
+            start = arrays.start_points[seg_index]
+            end = arrays.end_points[seg_index]
+            coords[inside] = start + (end - start) * progress[:, np.newaxis]
+        return coords
 
     def _interpolate_point(
         self, start: Point3D, end: Point3D, progress: float
@@ -317,6 +608,38 @@ class Track:
         segment = self.get_segment_at_position(position)
         return segment.curvature if segment else 0.0
 
+    def profile_at(self, positions) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get elevation, banking and curvature for many positions at once.
+
+        Vectorized equivalent of get_elevation_at_position(),
+        get_banking_at_position() and get_curvature_at_position(), sharing a
+        single segment lookup per position.
+
+        Args:
+            positions: Sequence or array of distances from start of track
+
+        Returns:
+            Tuple of (elevation, banking, curvature) arrays, one entry per
+            position (all zeros if track has no geometry)
+        """
+        positions = np.asarray(positions, dtype=np.float64)
+        if not self.segments:
+            zeros = np.zeros(positions.shape, dtype=np.float64)
+            return zeros, zeros.copy(), zeros.copy()
+
+        arrays = self.get_segment_arrays()
+        elevation = self.get_coordinates_at_positions(positions)[:, 2]
+
+        # Segment lookups are not wrapped; positions past the end use the last
+        # segment and positions before the start have none
+        index = np.searchsorted(arrays.starts, positions, side="right") - 1
+        on_track = index >= 0
+        safe_index = np.maximum(index, 0)
+        banking = np.where(on_track, arrays.banking[safe_index], 0.0)
+        curvature = np.where(on_track, arrays.curvature[safe_index], 0.0)
+        return elevation, banking, curvature
+
     def get_recommended_speed_at_position(
         self, position: float, agent_max_speed: float
     ) -> float:
@@ -419,9 +742,8 @@ class Track:
         Returns:
             Progress as percentage (0-100)
         """
-        total_distance = self.length * self.num_laps
         current_distance = (lap * self.length) + position
-        return min(100.0, (current_distance / total_distance) * 100)
+        return min(100.0, (current_distance / self.total_distance) * 100)
 
     def is_race_complete(self, lap: int) -> bool:
         """
@@ -442,7 +764,7 @@ class Track:
             "length": self.length,
             "num_laps": self.num_laps,
             "track_type": self.track_type,
-            "total_distance": self.length * self.num_laps,
+            "total_distance": self.total_distance,
             "checkpoints": len(self.checkpoints),
             "has_geometry": len(self.segments) > 0,
             "num_segments": len(self.segments),
@@ -450,36 +772,56 @@ class Track:
 
         # Add geometry statistics if available
         if self.segments:
-            corners = sum(1 for s in self.segments if s.is_corner())
-            straights = len(self.segments) - corners
-            total_elevation_gain = sum(
-                max(0, s.elevation_change) for s in self.segments
-            )
-            total_elevation_loss = sum(
-                abs(min(0, s.elevation_change)) for s in self.segments
-            )
-            max_banking = max((s.banking for s in self.segments), default=0.0)
-
-            info.update(
-                {
-                    "corners": corners,
-                    "straights": straights,
-                    "elevation_gain": round(total_elevation_gain, 2),
-                    "elevation_loss": round(total_elevation_loss, 2),
-                    "max_banking": round(max_banking, 2),
-                    "coordinates": [
-                        {
-                            "x": seg.start_point.x,
-                            "y": seg.start_point.y,
-                            "z": seg.start_point.z,
-                        }
-                        for seg in self.segments
-                    ],
-                }
-            )
+            info.update(self._get_geometry_stats())
+            # Hand out copies so callers cannot edit the cached coordinates
+            info["coordinates"] = [dict(c) for c in info["coordinates"]]
 
         return info
 
+    def _get_geometry_stats(self) -> Dict[str, Any]:
+        """
+        Get segment-derived statistics for get_info().
+
+        These only depend on the segments, so they are computed in one pass and
+        cached until the segments list changes. The returned dict is the cache
+        itself and must not be modified.
+
+        Returns:
+            Dictionary of geometry statistics
+        """
+        self._sync_segment_caches()
+        if self._geometry_stats is None:
+            corners = 0
+            total_elevation_gain = 0
+            total_elevation_loss = 0
+            max_banking = 0.0
+            coordinates = []
+
+            for i, seg in enumerate(self.segments):
+                if seg.is_corner():
+                    corners += 1
+                total_elevation_gain += max(0, seg.elevation_change)
+                total_elevation_loss += abs(min(0, seg.elevation_change))
+                if i == 0 or seg.banking > max_banking:
+                    max_banking = seg.banking
+                coordinates.append(
+                    {
+                        "x": seg.start_point.x,
+                        "y": seg.start_point.y,
+                        "z": seg.start_point.z,
+                    }
+                )
+
+            self._geometry_stats = {
+                "corners": corners,
+                "straights": len(self.segments) - corners,
+                "elevation_gain": round(total_elevation_gain, 2),
+                "elevation_loss": round(total_elevation_loss, 2),
+                "max_banking": round(max_banking, 2),
+                "coordinates": coordinates,
+            }
+        return self._geometry_stats
+
     def get_track_profile(self) -> Dict[str, Any]:
         """
         Get detailed track profile including all segments.
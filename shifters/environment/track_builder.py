@@ -195,7 +195,8 @@ class TrackBuilder:
             name=f"{name}_exit" if name else None,
         )
 
-        # Mark the last two segments as chicane
+        # Mark the last two segments as chicane. Tracks already built share
+        # this list; it grew in this call, so their caches are dropped anyway
         if len(self.segments) >= 2:
             self.segments[-2].segment_type = "chicane"
             self.segments[-1].segment_type = "chicane"
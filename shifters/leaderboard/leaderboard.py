@@ -48,6 +48,7 @@ class Leaderboard:
         """Initialize the leaderboard."""
         self.agents: Dict[str, AgentRanking] = {}
         self._sorted_rankings: List[AgentRanking] = []
+        self._rankings_dirty = False
         self.total_updates = 0
         self.last_update_time = datetime.now()
 
@@ -63,7 +64,7 @@ class Leaderboard:
             ranking = AgentRanking(agent_id=agent_id, name=name)
             self.agents[agent_id] = ranking
             self._sorted_rankings.append(ranking)
-            self._update_rankings()
+            self._rankings_dirty = True
 
     def update_agent(
         self,
@@ -110,8 +111,8 @@ class Leaderboard:
         self.total_updates += 1
         self.last_update_time = datetime.now()
 
-        # Re-sort rankings
-        self._update_rankings()
+        # Rankings are re-sorted lazily, the next time they are read
+        self._rankings_dirty = True
 
     def _update_rankings(self):
         """Update the sorted rankings and assign rank numbers."""
@@ -124,6 +125,13 @@ class Leaderboard:
         for idx, ranking in enumerate(self._sorted_rankings, start=1):
             ranking.rank = idx
 
+        self._rankings_dirty = False
+
+    def _ensure_sorted(self):
+        """Re-sort the rankings if any agent changed since the last sort."""
+        if self._rankings_dirty:
+            self._update_rankings()
+
     def get_rankings(self) -> List[Dict[str, Any]]:
         """
         Get current rankings as a list.
@@ -131,6 +139,7 @@ class Leaderboard:
         Returns:
             List of agent rankings, sorted by position
         """
+        self._ensure_sorted()
         return [
             {
                 "rank": r.rank,
@@ -169,11 +178,13 @@ class Leaderboard:
             Current rank, or None if not found
         """
         if agent_id in self.agents:
+            self._ensure_sorted()
             return self.agents[agent_id].rank
         return None
 
     def get_finished_agents(self) -> List[Dict[str, Any]]:
         """Get all finished agents, sorted by finish position."""
+        self._ensure_sorted()
         finished = [r for r in self._sorted_rankings if r.finished]
         return [
             {
@@ -5,7 +5,7 @@ from mesa import Model, DataCollector
 from mesa.agent import AgentSet
 import time
 
-from shifters.agents.base_agent import MobilityAgent
+from shifters.agents.base_agent import MobilityAgent, RacingVehicle
 from shifters.environment.track import Track, Environment
 from shifters.environment.safety_car import SafetyCar, DNFManager
 from shifters.leaderboard.leaderboard import Leaderboard
@@ -33,13 +33,14 @@ class MobilitySimulation(Model):
 
         # Core components
         self.agent_set = AgentSet([], random=self.random)
-        self.environment = Environment(track)
+        # Set through the private fields: there are no agents to rebind yet
+        self._environment = Environment(track)
         self.leaderboard = Leaderboard()
         self.safety_car = SafetyCar(track_name=track.name)
         self.dnf_manager = DNFManager()
 
         # Simulation settings
-        self.time_step = time_step
+        self._time_step = time_step
         self.enable_live_updates = enable_live_updates
         self.current_step = 0
         self.current_lap = 0
@@ -48,9 +49,15 @@ class MobilitySimulation(Model):
         self.race_started = False
         self.race_finished = False
 
+        # Leading lap among active agents, maintained incrementally as laps
+        # complete; a full rescan is only needed when an agent joins or retires
+        self._leader_lap = 0
+        self._leader_lap_stale = False
+
         # Agent tracking
         self.agents_list: List[MobilityAgent] = []
         self.finished_agents: List[MobilityAgent] = []
+        self._racing_agents: List[RacingVehicle] = []
 
         # Event callbacks
         self.event_callbacks: Dict[str, List[Callable]] = {
@@ -72,6 +79,31 @@ class MobilitySimulation(Model):
             agent_reporters={"Position": "position", "Speed": "speed", "Lap": "lap"},
         )
 
+    @property
+    def time_step(self) -> float:
+        """Simulation time step in seconds."""
+        return self._time_step
+
+    @time_step.setter
+    def time_step(self, value: float):
+        self._time_step = value
+        self._rebind_agents()
+
+    @property
+    def environment(self) -> Environment:
+        """Environment (track and weather) the agents race in."""
+        return self._environment
+
+    @environment.setter
+    def environment(self, value: Environment):
+        self._environment = value
+        self._rebind_agents()
+
+    def _rebind_agents(self):
+        """Refresh the settings each agent caches from the model."""
+        for agent in self.agents_list:
+            agent._bind_model()
+
     def add_agent(self, agent: MobilityAgent):
         """
         Add an agent to the simulation.
@@ -79,8 +111,13 @@ class MobilitySimulation(Model):
         Args:
             agent: Agent instance to add
         """
+        # The agent may have been built before a setting changed
+        agent._bind_model()
         self.agent_set.add(agent)
         self.agents_list.append(agent)
+        if isinstance(agent, RacingVehicle):
+            self._racing_agents.append(agent)
+        self._leader_lap_stale = True
         self.leaderboard.register_agent(agent.unique_id, agent.name)
 
     def register_event_callback(self, event_type: str, callback: Callable):
@@ -115,14 +152,13 @@ class MobilitySimulation(Model):
         self.environment.update(self.time_step)
 
         # Check slipstream and DRS for racing vehicles
-        from shifters.agents.base_agent import RacingVehicle
-        racing_agents = [a for a in self.agents_list if isinstance(a, RacingVehicle)]
-        
+        racing_agents = self._racing_agents
+
+        # Check slipstream effect for the whole field at once
+        RacingVehicle.update_slipstream(racing_agents)
+
         for agent in racing_agents:
             if not agent.finished:
-                # Check slipstream effect
-                agent.check_slipstream(racing_agents)
-                
                 # Auto-manage DRS (activate on straights, deactivate in corners)
                 if agent.current_curvature == 0 and agent.speed > agent.max_speed * 0.7:
                     agent.activate_drs()
@@ -137,12 +173,16 @@ class MobilitySimulation(Model):
         self.current_step += 1
 
         # Process agent states and check for DNFs
-        from shifters.agents.base_agent import RacingVehicle
         dnf_occurred = False
         
         # Update current lap to the leading car's lap
-        if self.agents_list:
-            self.current_lap = max(agent.lap for agent in self.agents_list if not agent.finished) if any(not agent.finished for agent in self.agents_list) else 0
+        if self._leader_lap_stale:
+            self._leader_lap = max(
+                (agent.lap for agent in self.agents_list if not agent.finished),
+                default=0,
+            )
+            self._leader_lap_stale = False
+        self.current_lap = self._leader_lap
         
         for agent in self.agents_list:
             if not agent.finished:
@@ -162,6 +202,7 @@ class MobilitySimulation(Model):
                         if dnf:
                             agent.finish_race()
                             self.finished_agents.append(agent)
+                            self._leader_lap_stale = True
                             self.dnf_manager.record_dnf(agent.unique_id, agent.lap, reason)
                             dnf_occurred = True
                             continue
@@ -199,10 +240,12 @@ class MobilitySimulation(Model):
         if track.is_lap_complete(agent.position):
             lap_time = self.simulation_time
             if agent.lap_times:
-                lap_time = self.simulation_time - sum(agent.lap_times)
+                lap_time = self.simulation_time - agent.lap_times_total
 
             agent.complete_lap(lap_time)
             agent.position = track.normalize_position(agent.position)
+            if agent.lap > self._leader_lap:
+                self._leader_lap = agent.lap
 
             self.trigger_event(
                 "lap_complete", agent=agent, lap=agent.lap, lap_time=lap_time
@@ -212,6 +255,7 @@ class MobilitySimulation(Model):
             if track.is_race_complete(agent.lap):
                 agent.finish_race()
                 self.finished_agents.append(agent)
+                self._leader_lap_stale = True
                 self.trigger_event(
                     "agent_finish", agent=agent, position=len(self.finished_agents)
                 )
@@ -1,6 +1,7 @@
 """Optimal pit strategy calculator based on F1-metrics research."""
 
 from typing import List, Dict, Tuple, Optional
+import heapq
 import numpy as np
 from dataclasses import dataclass
 
@@ -253,10 +254,9 @@ class PitStrategyCalculator:
                             description=f"{desc} ({stint1}L-{stint2}L-{stint3}L)"
                         ))
         
-        # Sort by total time
-        strategies.sort(key=lambda s: s.total_time)
-        
-        return strategies[:10]  # Return top 10 strategies
+        # Return the 10 fastest strategies; a bounded heap avoids sorting the
+        # whole candidate list (thousands of 2-stop combinations)
+        return heapq.nsmallest(10, strategies, key=lambda s: s.total_time)
     
     def calculate_undercut_window(
         self,
@@ -3,7 +3,7 @@
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse, FileResponse
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Dict, Any
+from typing import Dict, Any
 import asyncio
 import json
 from pathlib import Path
@@ -22,8 +22,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Store active simulations
-websocket_clients: List[WebSocket] = []
+# Outgoing messages per connected client; each connection has its own writer
+# task so a slow client only ever holds back (and drops) its own snapshots
+client_queues: Dict[WebSocket, asyncio.Queue] = {}
+SEND_QUEUE_SIZE = 16
 
 # F1 Circuits data
 F1_CIRCUITS_FILE = (
@@ -37,10 +39,8 @@ def load_f1_circuits_list():
         return []
 
     try:
-        with open(F1_CIRCUITS_FILE, "r", encoding="utf-8") as f:
-            geojson_data = json.load(f)
-        circuits = GeoJSONTrackParser.list_circuits_in_collection(geojson_data)
-        return circuits
+        # The parser caches the parsed file until it changes on disk
+        return GeoJSONTrackParser.list_circuits_in_file(str(F1_CIRCUITS_FILE))
     except Exception as e:
         print(f"Error loading F1 circuits: {e}")
         return []
@@ -55,17 +55,14 @@ class SimulationManager:
 
     async def broadcast_state(self, state: Dict[str, Any]):
         """Broadcast simulation state to all connected clients."""
-        disconnected = []
-        for client in websocket_clients:
-            try:
-                await client.send_json(state)
-            except:
-                disconnected.append(client)
+        # Encode once for every client (same format as WebSocket.send_json)
+        message = json.dumps(state, separators=(",", ":"), ensure_ascii=False)
 
-        # Remove disconnected clients
-        for client in disconnected:
-            if client in websocket_clients:
-                websocket_clients.remove(client)
+        for queue in list(client_queues.values()):
+            # Drop the oldest snapshot if this client has fallen behind
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(message)
 
     async def run_simulation(self, config: Dict[str, Any]):
         """Run a simulation with the given configuration."""
@@ -244,11 +241,33 @@ async def get_simulation_state():
     return {"error": "No active simulation"}
 
 
+async def client_writer(websocket: WebSocket, queue: asyncio.Queue):
+    """Send queued broadcast messages to one client until it disconnects."""
+    try:
+        while True:
+            message = await queue.get()
+            await websocket.send_text(message)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        remove_client(websocket)
+        # Close the connection too, so its endpoint stops waiting on it
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+
+
+def remove_client(websocket: WebSocket):
+    """Stop broadcasting to a client."""
+    client_queues.pop(websocket, None)
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates."""
     await websocket.accept()
-    websocket_clients.append(websocket)
+    writer = None
 
     try:
         # Send initial state if simulation exists
@@ -256,14 +275,22 @@ async def websocket_endpoint(websocket: WebSocket):
             state = sim_manager.simulation.get_simulation_state()
             await websocket.send_json(state)
 
+        # Register for broadcasts once the initial state is out
+        queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        client_queues[websocket] = queue
+        writer = asyncio.create_task(client_writer(websocket, queue))
+
         # Keep connection alive and listen for messages
         while True:
             data = await websocket.receive_text()
             # Handle client messages if needed
 
     except WebSocketDisconnect:
-        if websocket in websocket_clients:
-            websocket_clients.remove(websocket)
+        pass
+    finally:
+        remove_client(websocket)
+        if writer:
+            writer.cancel()
 
 
 @app.get("/api/circuits")
@@ -279,7 +306,7 @@ async def health_check():
     return {
         "status": "healthy",
         "simulation_running": sim_manager.running,
-        "connected_clients": len(websocket_clients),
+        "connected_clients": len(client_queues),
     }
 
 
@@ -0,0 +1,115 @@
+"""Tests for agent behaviour in a simulation."""
+
+import random
+
+import pytest
+
+from shifters.agents.base_agent import MobilityAgent, RacingVehicle
+from shifters.environment.track import Environment, Point3D, Track, TrackSegment
+from shifters.simcore.simulator import MobilitySimulation
+
+
+def straight(segment_id: str, start: float, end: float) -> TrackSegment:
+    return TrackSegment(
+        segment_id, Point3D(start, 0, 0), Point3D(end, 0, 0), "straight", end - start
+    )
+
+
+def test_position_wraps_at_current_track_length():
+    track = Track(length=100.0, segments=[straight("s1", 0, 100)])
+    sim = MobilitySimulation(track=track)
+    car = RacingVehicle(sim, "car")
+    sim.add_agent(car)
+
+    # Lengthen the track after the car exists
+    track.add_segment(straight("s2", 100, 200))
+    car.target_speed = 0.0  # Stationary car: _move only runs the wrap check
+    car.position = 150.0
+    car._move()
+
+    assert car.position == 150.0
+    assert not car.just_crossed_line
+
+    car.position = 210.0
+    car._move()
+
+    assert car.position == 10.0
+    assert car.just_crossed_line
+
+
+def test_agents_follow_reassigned_time_step_and_environment():
+    sim = MobilitySimulation(track=Track(length=1000.0), time_step=0.1)
+    agent = MobilityAgent(sim, "agent")
+    car = RacingVehicle(sim, "car")
+    sim.add_agent(agent)
+    sim.add_agent(car)
+
+    sim.time_step = 0.5
+    agent.speed = 10.0
+    agent._move()
+
+    assert agent.position == 5.0
+
+    sim.environment = Environment(Track(length=40.0))
+    car.target_speed = 0.0  # Stationary car: _move only runs the wrap check
+    car.position = 50.0
+    car._move()
+
+    assert car.position == 10.0
+    assert car.just_crossed_line
+
+
+def test_time_step_change_mid_run_matches_simulation_time():
+    sim = MobilitySimulation(track=Track(length=100000.0), time_step=0.1)
+    agent = MobilityAgent(sim, "agent", max_speed=20.0)
+    sim.add_agent(agent)
+    agent.speed = agent.max_speed  # Constant speed: distance is speed * time
+
+    for _ in range(10):
+        sim.step()
+    sim.time_step = 0.5
+    for _ in range(10):
+        sim.step()
+
+    assert sim.simulation_time == pytest.approx(6.0)
+    assert agent.distance_traveled == pytest.approx(20.0 * sim.simulation_time)
+
+
+def test_wrap_follows_track_swapped_on_environment():
+    sim = MobilitySimulation(track=Track(length=1000.0))
+    car = RacingVehicle(sim, "car")
+    sim.add_agent(car)
+
+    sim.environment.track = Track(length=40.0)
+    car.target_speed = 0.0  # Stationary car: _move only runs the wrap check
+    car.position = 50.0
+    car._move()
+
+    assert car.position == 10.0
+
+
+def test_update_slipstream_matches_pairwise_check():
+    rng = random.Random(3)
+    track = Track(length=300.0)
+    sim = MobilitySimulation(track=track)
+    cars = [RacingVehicle(sim, f"car_{i}") for i in range(25)]
+
+    for _ in range(200):
+        for car in cars:
+            car.lap = rng.randint(0, 2)
+            # Whole-metre positions make exact ties and 50 m gaps likely
+            car.position = float(rng.randint(0, 300))
+            car.finished = rng.random() < 0.2
+
+        expected = {}
+        for car in cars:
+            if not car.finished:
+                car.check_slipstream(cars)
+                expected[car.unique_id] = car.in_slipstream
+            car.in_slipstream = None
+
+        RacingVehicle.update_slipstream(cars)
+
+        assert {
+            car.unique_id: car.in_slipstream for car in cars if not car.finished
+        } == expected
@@ -0,0 +1,71 @@
+"""Tests for the process-pool batch runner."""
+
+import pytest
+
+from shifters.config.scenarios import ScenarioConfig
+from shifters.simcore.batch import run_batch, run_scenario, sweep_configs
+
+
+def make_config(name: str, agent_type: str = "RacingVehicle") -> ScenarioConfig:
+    return ScenarioConfig(
+        name=name,
+        description="Test scenario",
+        track_length=500.0,
+        num_laps=2,
+        track_type="circuit",
+        num_agents=3,
+        agent_type=agent_type,
+        agent_params={"max_speed": 50.0},
+        seed=7,
+    )
+
+
+def test_run_batch_returns_results_in_config_order():
+    configs = [make_config(f"Race {i}") for i in range(4)]
+
+    results = run_batch(configs, max_steps=20, max_workers=2)
+
+    assert [r["scenario"] for r in results] == [c.name for c in configs]
+    for result in results:
+        assert result["steps"] == 20
+        assert len(result["standings"]) == 3
+
+
+def test_run_batch_matches_run_scenario():
+    configs = [make_config(f"Race {i}") for i in range(3)]
+
+    results = run_batch(configs, max_steps=200, max_workers=2)
+
+    assert results == [run_scenario(c, max_steps=200) for c in configs]
+
+
+def test_run_batch_empty():
+    assert run_batch([], max_steps=20) == []
+
+
+def test_unknown_agent_type_raises_key_error():
+    config = make_config("Bad", agent_type="Hovercraft")
+
+    with pytest.raises(KeyError):
+        run_scenario(config, max_steps=5)
+    with pytest.raises(KeyError):
+        run_batch([config], max_steps=5, max_workers=1)
+
+
+def test_max_steps_must_be_positive():
+    with pytest.raises(ValueError):
+        run_scenario(make_config("Race"), max_steps=0)
+
+
+def test_sweep_configs_varies_one_parameter():
+    base = make_config("Race")
+
+    configs = sweep_configs(base, "cornering_skill", [0.9, 1.1])
+
+    assert [c.name for c in configs] == [
+        "Race (cornering_skill=0.9)",
+        "Race (cornering_skill=1.1)",
+    ]
+    assert [c.agent_params["cornering_skill"] for c in configs] == [0.9, 1.1]
+    assert all(c.agent_params["max_speed"] == 50.0 for c in configs)
+    assert "cornering_skill" not in base.agent_params
@@ -0,0 +1,31 @@
+"""Tests for loading circuits from GeoJSON files."""
+
+import json
+from pathlib import Path
+
+from shifters.environment import geojson_parser
+from shifters.environment.geojson_parser import GeoJSONTrackParser
+
+F1_CIRCUITS_FILE = (
+    Path(__file__).parent.parent / "data" / "circuits" / "f1-circuits.geojson"
+)
+
+
+def test_list_circuits_in_file_matches_collection_listing():
+    with open(F1_CIRCUITS_FILE, "r", encoding="utf-8") as f:
+        geojson_data = json.load(f)
+
+    circuits = GeoJSONTrackParser.list_circuits_in_file(str(F1_CIRCUITS_FILE))
+
+    assert circuits == GeoJSONTrackParser.list_circuits_in_collection(geojson_data)
+
+
+def test_list_circuits_in_file_parses_once():
+    GeoJSONTrackParser.list_circuits_in_file(str(F1_CIRCUITS_FILE))
+    misses = geojson_parser._load_collection.cache_info().misses
+
+    circuits = GeoJSONTrackParser.list_circuits_in_file(str(F1_CIRCUITS_FILE))
+    circuits.clear()  # Callers get their own list
+
+    assert geojson_parser._load_collection.cache_info().misses == misses
+    assert GeoJSONTrackParser.list_circuits_in_file(str(F1_CIRCUITS_FILE))
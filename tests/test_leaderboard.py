@@ -0,0 +1,46 @@
+"""Tests for leaderboard ranking."""
+
+import random
+
+from shifters.leaderboard.leaderboard import Leaderboard
+
+
+def test_lazy_rankings_match_full_sort():
+    rng = random.Random(5)
+    leaderboard = Leaderboard()
+    ids = [f"agent_{i}" for i in range(12)]
+    for agent_id in ids:
+        leaderboard.register_agent(agent_id, agent_id.upper())
+
+    for _ in range(300):
+        agent_id = rng.choice(ids)
+        leaderboard.update_agent(
+            agent_id,
+            lap=rng.randint(0, 3),
+            position_on_track=float(rng.randint(0, 50)),
+            finished=rng.random() < 0.05,
+            time=rng.uniform(0, 100),
+        )
+        if rng.random() < 0.3:
+            continue  # Let several updates pile up before the next read
+
+        expected = sorted(leaderboard.agents.values(), key=lambda r: r.get_sort_key())
+        rankings = leaderboard.get_rankings()
+
+        assert [r["id"] for r in rankings] == [r.agent_id for r in expected]
+        assert [r["rank"] for r in rankings] == list(range(1, len(ids) + 1))
+        for rank, ranking in enumerate(expected, start=1):
+            assert leaderboard.get_agent_rank(ranking.agent_id) == rank
+
+
+def test_finished_agents_in_finish_order():
+    leaderboard = Leaderboard()
+    for agent_id in ["a", "b", "c"]:
+        leaderboard.register_agent(agent_id, agent_id)
+
+    leaderboard.update_agent("b", lap=3, finished=True, time=10.0)
+    leaderboard.update_agent("a", lap=2, position_on_track=40.0)
+    leaderboard.update_agent("c", lap=3, finished=True, time=12.0)
+
+    assert [r["id"] for r in leaderboard.get_finished_agents()] == ["b", "c"]
+    assert [r["id"] for r in leaderboard.get_rankings()] == ["b", "c", "a"]
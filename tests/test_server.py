@@ -0,0 +1,49 @@
+"""Tests for the visualization server's client handling."""
+
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from shifters.ui import server
+
+
+class FailingWebSocket:
+    """Stand-in socket whose sends always fail."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def send_text(self, message):
+        raise ConnectionError("client went away")
+
+    async def close(self):
+        self.closed = True
+
+
+def test_failed_send_unregisters_and_closes_client():
+    websocket = FailingWebSocket()
+
+    async def run():
+        queue = asyncio.Queue(maxsize=server.SEND_QUEUE_SIZE)
+        server.client_queues[websocket] = queue
+        queue.put_nowait("{}")
+        await server.client_writer(websocket, queue)
+
+    asyncio.run(run())
+
+    assert websocket not in server.client_queues
+    assert websocket.closed
+
+
+def test_health_counts_connected_clients():
+    client = TestClient(server.app)
+    assert client.get("/health").json()["connected_clients"] == 0
+
+    with client.websocket_connect("/ws"):
+        # The endpoint registers the client before waiting for messages
+        for _ in range(100):
+            if client.get("/health").json()["connected_clients"] == 1:
+                break
+        assert client.get("/health").json()["connected_clients"] == 1
+
+    assert client.get("/health").json()["connected_clients"] == 0
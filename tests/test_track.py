@@ -0,0 +1,258 @@
+"""Tests for track geometry queries."""
+
+import numpy as np
+import pytest
+
+from shifters.environment.track import Point3D, Track, TrackSegment
+
+
+def make_segments():
+    """A closed circuit mixing straights, corners, surfaces and limits."""
+    return [
+        TrackSegment("s1", Point3D(0, 0, 0), Point3D(400, 0, 2), "straight", 400.0),
+        TrackSegment(
+            "c1",
+            Point3D(400, 0, 2),
+            Point3D(500, 100, 5),
+            "right_turn",
+            160.0,
+            curvature=60.0,
+            banking=8.0,
+        ),
+        TrackSegment(
+            "c2",
+            Point3D(500, 100, 5),
+            Point3D(450, 200, 3),
+            "left_turn",
+            120.0,
+            curvature=25.0,
+            banking=-4.0,
+            surface_type="gravel",
+        ),
+        TrackSegment(
+            "s2",
+            Point3D(450, 200, 3),
+            Point3D(100, 200, 1),
+            "straight",
+            350.0,
+            speed_limit=60.0,
+        ),
+        TrackSegment(
+            "c3",
+            Point3D(100, 200, 1),
+            Point3D(0, 0, 0),
+            "chicane",
+            240.0,
+            curvature=40.0,
+            speed_limit=30.0,
+        ),
+    ]
+
+
+def make_irregular_segments(count: int = 40, seed: int = 7):
+    """Straights and corners with non-round lengths, for boundary checks."""
+    rng = np.random.default_rng(seed)
+    segments = []
+    start = Point3D(0.0, 0.0, 0.0)
+    for i in range(count):
+        length = float(rng.uniform(0.3, 90.0))
+        end = Point3D(
+            start.x + length, float(rng.uniform(-5, 5)), float(rng.uniform(0, 9))
+        )
+        corner = i % 3 == 1
+        segments.append(
+            TrackSegment(
+                f"seg{i}",
+                start,
+                end,
+                "left_turn" if corner else "straight",
+                length,
+                curvature=float(rng.uniform(10, 200)) if corner else 0.0,
+                banking=float(rng.uniform(-10, 10)),
+            )
+        )
+        start = end
+    return segments
+
+
+def reference_segment(track, position):
+    """Linear-scan segment lookup the bisect search replaced."""
+    accumulated = 0.0
+    for segment in track.segments:
+        if accumulated <= position < accumulated + segment.length:
+            return segment
+        accumulated += segment.length
+    return track.segments[-1] if position >= accumulated else None
+
+
+def reference_coordinates(track, position):
+    """Linear-scan coordinate lookup the bisect search replaced."""
+    if track.track_type == "circuit":
+        position = position % track.length
+    accumulated = 0.0
+    for segment in track.segments:
+        segment_end = accumulated + segment.length
+        if accumulated <= position < segment_end:
+            progress = (position - accumulated) / segment.length
+            return track._interpolate_point(
+                segment.start_point, segment.end_point, progress
+            )
+        accumulated += segment.length
+    return track.segments[-1].end_point
+
+
+def probe_positions(track):
+    """Segment boundaries, points just around them, and out-of-range values."""
+    starts = track.get_segment_arrays().starts.tolist()
+    positions = [-5.0, 0.0, track.length, track.length + 0.5, 2.5 * track.length]
+    for start in starts:
+        positions += [start, np.nextafter(start, -np.inf), start + 0.25]
+    return positions
+
+
+@pytest.fixture
+def track():
+    return Track(length=1270.0, num_laps=3, segments=make_segments())
+
+
+@pytest.fixture(params=["circuit", "linear"])
+def irregular_track(request):
+    segments = make_irregular_segments()
+    length = sum(seg.length for seg in segments)
+    return Track(length=length, track_type=request.param, segments=segments)
+
+
+def test_segment_lookup_matches_linear_scan(irregular_track):
+    for position in probe_positions(irregular_track):
+        assert irregular_track.get_segment_at_position(position) is reference_segment(
+            irregular_track, position
+        )
+
+
+def test_coordinates_match_linear_scan(irregular_track):
+    for position in probe_positions(irregular_track):
+        assert irregular_track.get_coordinates_at_position(
+            position
+        ) == reference_coordinates(irregular_track, position)
+
+
+def test_geometry_lookup_matches_separate_queries(irregular_track):
+    for position in probe_positions(irregular_track):
+        segment, coordinates = irregular_track.get_geometry_at_position(position)
+        assert segment is irregular_track.get_segment_at_position(position)
+        assert coordinates == irregular_track.get_coordinates_at_position(position)
+
+
+def test_batch_coordinates_match_scalar(irregular_track):
+    positions = probe_positions(irregular_track)
+
+    coords = irregular_track.get_coordinates_at_positions(positions)
+
+    expected = [
+        (p.x, p.y, p.z)
+        for p in map(irregular_track.get_coordinates_at_position, positions)
+    ]
+    assert [tuple(row) for row in coords.tolist()] == expected
+
+
+def test_profile_matches_scalar_queries(irregular_track):
+    positions = probe_positions(irregular_track)
+
+    elevation, banking, curvature = irregular_track.profile_at(positions)
+
+    assert elevation.tolist() == [
+        irregular_track.get_elevation_at_position(p) for p in positions
+    ]
+    assert banking.tolist() == [
+        irregular_track.get_banking_at_position(p) for p in positions
+    ]
+    assert curvature.tolist() == [
+        irregular_track.get_curvature_at_position(p) for p in positions
+    ]
+
+
+def test_segment_arrays_match_segments(irregular_track):
+    arrays = irregular_track.get_segment_arrays()
+    segments = irregular_track.segments
+
+    accumulated = 0.0
+    for i, seg in enumerate(segments):
+        assert arrays.starts[i] == accumulated
+        assert arrays.lengths[i] == seg.length
+        assert arrays.curvature[i] == seg.curvature
+        assert arrays.banking[i] == seg.banking
+        assert arrays.start_points[i].tolist() == [
+            seg.start_point.x,
+            seg.start_point.y,
+            seg.start_point.z,
+        ]
+        accumulated += seg.length
+
+
+def test_queries_without_geometry():
+    track = Track(length=1000.0)
+
+    assert track.get_segment_at_position(10.0) is None
+    assert track.get_coordinates_at_positions([10.0]) is None
+    elevation, banking, curvature = track.profile_at([10.0, 20.0])
+    assert elevation.tolist() == banking.tolist() == curvature.tolist() == [0.0, 0.0]
+
+
+@pytest.mark.parametrize("base_speed", [20.0, 50.0, 90.0])
+def test_recommended_speeds_match_segment_method(track, base_speed):
+    expected = [seg.get_recommended_speed(base_speed) for seg in track.segments]
+
+    assert track.get_recommended_speeds(base_speed).tolist() == expected
+
+
+def test_caches_follow_in_place_segment_changes(track):
+    track.get_info()
+    track.get_segment_arrays()
+    assert track.get_segment_at_position(1300.0) is track.segments[-1]
+
+    extra = TrackSegment(
+        "c4", Point3D(0, 0, 0), Point3D(50, -50, 0), "left_turn", 80.0, curvature=30.0
+    )
+    track.segments.append(extra)
+
+    assert track.get_segment_at_position(1300.0) is extra
+    assert track.get_segment_arrays().lengths.size == 6
+    assert track.get_info()["num_segments"] == 6
+    assert track.num_corners == 4
+
+
+def test_caches_follow_replaced_segments_list(track):
+    track.get_segment_arrays()
+
+    track.segments = make_segments()[:2]
+
+    assert track.get_segment_arrays().lengths.tolist() == [400.0, 160.0]
+    assert track.get_info()["corners"] == 1
+
+
+def test_invalidate_caches_after_editing_a_segment(track):
+    track.get_segment_arrays()
+    track.get_info()
+    corner = track.segments[1]
+
+    corner.length = 200.0
+    corner.curvature = 90.0
+    corner.segment_type = "straight"
+    track.invalidate_caches()
+
+    arrays = track.get_segment_arrays()
+    assert arrays.lengths[1] == 200.0
+    assert arrays.curvature[1] == 90.0
+    assert track.length == pytest.approx(arrays.lengths.sum())
+    assert track.get_segment_at_position(590.0) is corner
+    assert track.num_corners == 2
+
+
+def test_get_info_returns_copied_coordinates(track):
+    info = track.get_info()
+    info["coordinates"][0]["x"] = 999.0
+    info["coordinates"].clear()
+
+    coords = track.get_info()["coordinates"]
+    assert len(coords) == 5
+    assert coords[0]["x"] == 0